@@ -9,12 +9,17 @@ from typing import Dict, Any, Tuple
 import math
 import pygame
 from settings import (
-    TRACK_COLORS, SLOW_DOWN_MULTIPLIER, COLORS, 
+    TRACK_CLASS_IDS, SLOW_DOWN_MULTIPLIER, COLORS,
     PHYSICS_ADJUSTMENT, SCREEN_WIDTH, SCREEN_HEIGHT,
     WALL_STICKINESS, WALL_BOUNCE_FACTOR, REVERSE_SPEED_MULTIPLIER
 )
 from game_settings import game_settings
 
+# Collision class IDs bound once; the hot paths below compare these ints
+# instead of RGB tuples
+WALL_CLASS = TRACK_CLASS_IDS['WALL']
+SLOW_DOWN_CLASS = TRACK_CLASS_IDS['SLOW_DOWN']
+
 
 class Car:
     """
@@ -49,8 +54,9 @@ class Car:
         self.friction: float = stats['friction']
         self.turn_speed: float = stats['turn_speed']
         
-        # Visual properties
-        self.color: Tuple[int, int, int] = stats['color']
+        # Visual properties (normalize to an RGB tuple - presets may hold
+        # pygame.Color objects, which iterate as four components)
+        self.color: Tuple[int, int, int] = tuple(stats['color'])[:3]
         self.size: Tuple[int, int] = stats['size']
         self.image_path: str = stats.get('image_path', '') or ''
         
@@ -66,6 +72,7 @@ class Car:
         self.on_slow_surface: bool = False
         self.collision_bounce_factor: float = WALL_BOUNCE_FACTOR
         self.is_reversing: bool = False
+        self.ui_dirty: bool = True  # Set when velocity/reversing state changes
     
     def _create_car_surface(self) -> pygame.Surface:
         """
@@ -158,24 +165,30 @@ class Car:
         
         return world_points
     
-    def update(self, keys_pressed, controls: Dict[str, int], 
+    def update(self, keys_pressed, controls: Tuple[int, int, int, int],
                track) -> None:
         """
         Update the car's position and physics based on input and track conditions.
-        
+
         Args:
             keys_pressed: Pygame key state from pygame.key.get_pressed()
-            controls: Control scheme for this car
+            controls: (accelerate, brake, turn_left, turn_right) scancodes
             track: Track object for collision detection
         """
-        # Handle input
-        accelerating = keys_pressed[controls['accelerate']]
-        braking = keys_pressed[controls['brake']]
-        turning_left = keys_pressed[controls['turn_left']]
-        turning_right = keys_pressed[controls['turn_right']]
-        
+        # Handle input - resolve all four key states in one unpack
+        accel_key, brake_key, left_key, right_key = controls
+        accelerating, braking, turning_left, turning_right = (
+            keys_pressed[accel_key],
+            keys_pressed[brake_key],
+            keys_pressed[left_key],
+            keys_pressed[right_key],
+        )
+
+        # Remember the state the HUD displays so we can flag changes
+        old_velocity = (self.velocity_x, self.velocity_y, self.is_reversing)
+
         # Calculate current speed for various calculations
-        speed = math.sqrt(self.velocity_x**2 + self.velocity_y**2)
+        speed = math.hypot(self.velocity_x, self.velocity_y)
         
         # Determine if we're moving forward or backward
         angle_rad = math.radians(self.angle)
@@ -200,27 +213,25 @@ class Car:
             if turning_right:
                 self.angle += turn_amount
         
+        # Heading vector after turning, shared by the accelerate and
+        # reverse branches below
+        angle_rad = math.radians(self.angle)
+        heading_x = math.cos(angle_rad)
+        heading_y = math.sin(angle_rad)
+
         # Handle acceleration and braking/reverse
         if accelerating:
             # Forward acceleration
-            angle_rad = math.radians(self.angle)
-            accel_x = math.cos(angle_rad) * self.acceleration
-            accel_y = math.sin(angle_rad) * self.acceleration
-            
-            self.velocity_x += accel_x
-            self.velocity_y += accel_y
-        
+            self.velocity_x += heading_x * self.acceleration
+            self.velocity_y += heading_y * self.acceleration
+
         if braking:
             # Check if we're already moving backward or stopped
             if speed < 0.5:
                 # Start reversing
-                angle_rad = math.radians(self.angle)
                 reverse_accel = self.acceleration * REVERSE_SPEED_MULTIPLIER
-                accel_x = -math.cos(angle_rad) * reverse_accel
-                accel_y = -math.sin(angle_rad) * reverse_accel
-                
-                self.velocity_x += accel_x
-                self.velocity_y += accel_y
+                self.velocity_x -= heading_x * reverse_accel
+                self.velocity_y -= heading_y * reverse_accel
             else:
                 # Apply braking force
                 brake_force = 0.3
@@ -234,7 +245,7 @@ class Car:
         self.velocity_y *= self.friction
         
         # Limit speed (different limits for forward and reverse)
-        current_speed = math.sqrt(self.velocity_x**2 + self.velocity_y**2)
+        current_speed = math.hypot(self.velocity_x, self.velocity_y)
         max_speed_to_use = self.current_max_speed
         
         if self.is_reversing:
@@ -261,8 +272,8 @@ class Car:
             self.y = new_y
             
             # Check surface type at new position
-            surface_color = track.check_collision(int(self.x), int(self.y))
-            if surface_color == TRACK_COLORS['SLOW_DOWN']:
+            surface_class = track.check_collision_class(int(self.x), int(self.y))
+            if surface_class == SLOW_DOWN_CLASS:
                 self.current_max_speed = self.max_speed * SLOW_DOWN_MULTIPLIER
                 self.on_slow_surface = True
             else:
@@ -275,6 +286,10 @@ class Car:
         
         # Update rotated surface for rendering
         self.rotated_surface = pygame.transform.rotate(self.base_surface, -self.angle)
+
+        # Flag the HUD when anything it displays changed
+        if (self.velocity_x, self.velocity_y, self.is_reversing) != old_velocity:
+            self.ui_dirty = True
     
     def _check_collision(self, new_x: float, new_y: float, track) -> Dict[str, Any]:
         """
@@ -297,8 +312,8 @@ class Car:
         
         # Check each collision point
         for point_x, point_y in collision_points:
-            surface_color = track.check_collision(point_x, point_y)
-            if surface_color == TRACK_COLORS['WALL']:
+            surface_class = track.check_collision_class(point_x, point_y)
+            if surface_class == WALL_CLASS:
                 wall_collisions.append((point_x, point_y))
         
         # Restore position
@@ -331,7 +346,7 @@ class Car:
         self.velocity_y *= bounce_factor * (1.0 - velocity_reduction)
         
         # Calculate current speed and direction
-        speed = math.sqrt(self.velocity_x**2 + self.velocity_y**2)
+        speed = math.hypot(self.velocity_x, self.velocity_y)
         
         if speed > 0.1:
             # Try to slide along the wall instead of stopping
@@ -391,14 +406,14 @@ class Car:
                 check_x = wall_x + dx * 2
                 check_y = wall_y + dy * 2
                 
-                surface_color = track.check_collision(check_x, check_y)
-                if surface_color != TRACK_COLORS['WALL']:
+                surface_class = track.check_collision_class(check_x, check_y)
+                if surface_class != WALL_CLASS:
                     # This direction points away from the wall
                     normal_x += dx
                     normal_y += dy
         
         # Normalize the normal vector
-        length = math.sqrt(normal_x**2 + normal_y**2)
+        length = math.hypot(normal_x, normal_y)
         if length > 0:
             normal_x /= length
             normal_y /= length
@@ -408,7 +423,7 @@ class Car:
                 wall_x, wall_y = wall_points[0]
                 dx = self.x - wall_x
                 dy = self.y - wall_y
-                length = math.sqrt(dx**2 + dy**2)
+                length = math.hypot(dx, dy)
                 if length > 0:
                     normal_x = dx / length
                     normal_y = dy / length
@@ -493,16 +508,21 @@ class Car:
                 )
             print(f"Acceleration adjusted to: {self.acceleration:.2f}")
     
-    def render(self, screen: pygame.Surface) -> None:
+    def render(self, screen: pygame.Surface) -> pygame.Rect:
         """
         Render the car to the screen with proper rotation.
-        
+
         Args:
             screen: The pygame surface to render to
+
+        Returns:
+            pygame.Rect: The screen area touched by this car (for dirty-rect updates)
         """
-        # Get the rect for the rotated surface and center it on the car's position
+        # Get the rect for the rotated surface and center it on the car's
+        # position, casting to int once instead of per draw call
+        ix, iy = int(self.x), int(self.y)
         rotated_rect = self.rotated_surface.get_rect()
-        rotated_rect.center = (int(self.x), int(self.y))
+        rotated_rect.center = (ix, iy)
         
         # Blit the rotated car to the screen
         screen.blit(self.rotated_surface, rotated_rect)
@@ -529,3 +549,6 @@ class Car:
         # Optional: Draw collision points for debugging
         # for point in self._get_collision_points_world():
         #     pygame.draw.circle(screen, COLORS['YELLOW'], point, 2)
+
+        # Inflate slightly so the reverse lights are covered as well
+        return rotated_rect.inflate(6, 6)
@@ -4,7 +4,7 @@ Control schemes for the racing game.
 This module defines the keyboard controls for both players.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import pygame
 
 # Player 1 controls (WASD)
@@ -23,6 +23,23 @@ PLAYER2_CONTROLS: Dict[str, int] = {
     'turn_right': pygame.K_RIGHT,
 }
 
+# Precomputed scancode tuples in (accelerate, brake, turn_left, turn_right)
+# order. Car.update indexes these directly each frame instead of doing four
+# dict lookups per car.
+PLAYER1_KEYS: Tuple[int, int, int, int] = (
+    PLAYER1_CONTROLS['accelerate'],
+    PLAYER1_CONTROLS['brake'],
+    PLAYER1_CONTROLS['turn_left'],
+    PLAYER1_CONTROLS['turn_right'],
+)
+
+PLAYER2_KEYS: Tuple[int, int, int, int] = (
+    PLAYER2_CONTROLS['accelerate'],
+    PLAYER2_CONTROLS['brake'],
+    PLAYER2_CONTROLS['turn_left'],
+    PLAYER2_CONTROLS['turn_right'],
+)
+
 # Physics adjustment controls
 PHYSICS_CONTROLS: Dict[str, int] = {
     'increase_turn_speed': pygame.K_u,
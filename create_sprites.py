@@ -21,7 +21,10 @@ def create_car_sprite(color: tuple, size: tuple, filename: str) -> bool:
         bool: True if successful, False otherwise
     """
     pygame.init()
-    
+
+    # Normalize to an RGB tuple (pygame.Color iterates as four components)
+    color = tuple(color)[:3]
+
     # Create surface with transparency
     sprite = pygame.Surface(size, pygame.SRCALPHA)
     sprite.fill((0, 0, 0, 0))  # Transparent background
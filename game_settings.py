@@ -6,7 +6,10 @@ that affect all cars and gameplay elements.
 """
 
 from typing import Dict, Any
-from settings import WALL_STICKINESS, WALL_BOUNCE_FACTOR, PHYSICS_ADJUSTMENT
+from settings import (
+    WALL_STICKINESS, WALL_BOUNCE_FACTOR, PHYSICS_ADJUSTMENT,
+    SPORTS_CAR, TRUCK,
+)
 
 
 class GameSettings:
@@ -18,6 +21,17 @@ class GameSettings:
         """Initialize game settings with default values."""
         self.wall_stickiness: float = WALL_STICKINESS
         self.wall_bounce_factor: float = WALL_BOUNCE_FACTOR
+
+        # Per-car settings surfaced by the web settings panel, seeded from
+        # the car presets (the panel reads these before any adjustment)
+        self.car1_acceleration: float = SPORTS_CAR['acceleration']
+        self.car1_max_speed: float = SPORTS_CAR['max_speed']
+        self.car1_friction: float = SPORTS_CAR['friction']
+        self.car1_turn_speed: float = SPORTS_CAR['turn_speed']
+        self.car2_acceleration: float = TRUCK['acceleration']
+        self.car2_max_speed: float = TRUCK['max_speed']
+        self.car2_friction: float = TRUCK['friction']
+        self.car2_turn_speed: float = TRUCK['turn_speed']
     
     def adjust_stickiness(self, increase: bool) -> None:
         """
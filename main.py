@@ -10,7 +10,7 @@ import sys
 import pygame
 
 from car import Car
-from controls import PLAYER1_CONTROLS, PLAYER2_CONTROLS
+from controls import PLAYER1_KEYS, PLAYER2_KEYS
 from game_settings import game_settings
 
 # Import core game modules
@@ -24,16 +24,26 @@ try:
 except ImportError:
     HAS_WEB_SETTINGS = False
 
+# Evaluated once at import time - Pygbag builds run under emscripten.
+# Web/native divergences branch on this constant instead of probing the
+# platform at runtime.
+IS_WEB: bool = sys.platform == "emscripten"
+
 
 class RacingGameWeb:
     """Web-compatible racing game class for Pygbag."""
 
     def __init__(self):
-        print("🌐 INITTING")
         """Initialize the web racing game."""
+        if IS_WEB:
+            print("🌐 INITTING")
         # Initialize pygame and display IMMEDIATELY
         pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Request vsync so presentation rides the display's refresh where
+        # the driver supports it (best effort - ignored otherwise)
+        self.screen = pygame.display.set_mode(
+            (SCREEN_WIDTH, SCREEN_HEIGHT), vsync=1
+        )
         pygame.display.set_caption(WINDOW_TITLE)
         self.clock = pygame.time.Clock()
 
@@ -41,6 +51,13 @@ class RacingGameWeb:
         self.track = Track()
         self.track.load_track()
 
+        # Pre-composite the static background (clear color + track) once, in
+        # the display's pixel format, so the per-frame render is one blit
+        self._background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._background.fill(COLORS["BLACK"])
+        self.track.render(self._background)
+        self._background = self._background.convert()
+
         # Get starting positions
         start_positions = self.track.get_start_positions()
         if len(start_positions) >= 2:
@@ -64,58 +81,119 @@ class RacingGameWeb:
         # Game state
         self.running = True
 
-    async def render_ui(self):
-        """Render UI elements."""
-        font = pygame.font.Font(None, 24)
+        # Precompute UI layout offsets - the instruction count never changes
+        instruction_count = 3 if self.web_settings else 2
+        self._p1_stats_y = 10 + instruction_count * 25 + 10
+        self._p2_stats_y = self._p1_stats_y + 2 * 25 + 10
 
+        # UI font and pre-rendered instruction lines (these never change)
+        self.font = pygame.font.Font(None, 24)
         instructions = [
             "Player 1: WASD (S for reverse)",
             "Player 2: Arrow Keys (↓ for reverse)",
         ]
-
         if self.web_settings:
             instructions.append("TAB: Settings Menu")
-
-        for i, instruction in enumerate(instructions):
-            text_surface = font.render(instruction, True, COLORS["WHITE"])
-            self.screen.blit(text_surface, (10, 10 + i * 25))
-
-        # Car stats
-        stats_y = 10 + len(instructions) * 25 + 10
-
-        car1_speed = math.sqrt(self.car1.velocity_x**2 + self.car1.velocity_y**2)
-        car1_stats = [
-            f"P1 Speed: {car1_speed:.1f}",
-            f"P1 Reverse: {'Yes' if self.car1.is_reversing else 'No'}",
-        ]
-
-        for i, stat in enumerate(car1_stats):
-            color = COLORS["RED"] if "Reverse: Yes" in stat else COLORS["YELLOW"]
-            text_surface = font.render(stat, True, color)
-            self.screen.blit(text_surface, (10, stats_y + i * 25))
-
-        p2_stats_y = stats_y + len(car1_stats) * 25 + 10
-        car2_speed = math.sqrt(self.car2.velocity_x**2 + self.car2.velocity_y**2)
-        car2_stats = [
-            f"P2 Speed: {car2_speed:.1f}",
-            f"P2 Reverse: {'Yes' if self.car2.is_reversing else 'No'}",
+        self._instruction_batch = [
+            (self.font.render(text, True, COLORS["WHITE"]), (10, 10 + i * 25))
+            for i, text in enumerate(instructions)
         ]
 
-        for i, stat in enumerate(car2_stats):
-            color = COLORS["RED"] if "Reverse: Yes" in stat else COLORS["BLUE"]
-            text_surface = font.render(stat, True, color)
-            self.screen.blit(text_surface, (10, p2_stats_y + i * 25))
+        # Stat line surface caches keyed by (player, quantized value) so the
+        # font only rasterizes when a displayed value actually changes
+        self._speed_cache = {}
+        self._reverse_cache = {}
+
+        # Current stat lines per player; rebuilt only when the car flags
+        # its displayed state as dirty (cars start dirty, so frame one fills
+        # these in)
+        self._p1_stat_lines = []
+        self._p2_stat_lines = []
+
+        # Dirty-rect bookkeeping: present only the changed regions instead of
+        # flipping the whole framebuffer; the settings overlay forces a flip
+        self._needs_full_flip = True
+        self._settings_was_visible = False
+        self._prev_dirty_rects = []
+        self._prev_ui_rects = []
+
+    def _speed_surface(self, player, car):
+        """Get the speed stat surface for a car, rendering only on cache miss."""
+        speed = math.hypot(car.velocity_x, car.velocity_y)
+        tenths = round(speed * 10)
+        key = (player, tenths)
+        surface = self._speed_cache.get(key)
+        if surface is None:
+            color = COLORS["YELLOW"] if player == 1 else COLORS["BLUE"]
+            surface = self.font.render(
+                f"P{player} Speed: {tenths / 10:.1f}", True, color
+            )
+            self._speed_cache[key] = surface
+        return surface
+
+    def _reverse_surface(self, player, car):
+        """Get the reverse stat surface for a car, rendering only on cache miss."""
+        key = (player, car.is_reversing)
+        surface = self._reverse_cache.get(key)
+        if surface is None:
+            if car.is_reversing:
+                color = COLORS["RED"]
+            else:
+                color = COLORS["YELLOW"] if player == 1 else COLORS["BLUE"]
+            surface = self.font.render(
+                f"P{player} Reverse: {'Yes' if car.is_reversing else 'No'}",
+                True,
+                color,
+            )
+            self._reverse_cache[key] = surface
+        return surface
+
+    def render_ui(self):
+        """Render UI elements and return the screen rects they covered."""
+        # Collect every (surface, position) pair and dispatch them through a
+        # single blits() call instead of one Python->C crossing per line
+        batch = list(self._instruction_batch)
+
+        if self.car1.ui_dirty:
+            self._p1_stat_lines = [
+                (self._speed_surface(1, self.car1), (10, self._p1_stats_y)),
+                (self._reverse_surface(1, self.car1), (10, self._p1_stats_y + 25)),
+            ]
+            self.car1.ui_dirty = False
+        if self.car2.ui_dirty:
+            self._p2_stat_lines = [
+                (self._speed_surface(2, self.car2), (10, self._p2_stats_y)),
+                (self._reverse_surface(2, self.car2), (10, self._p2_stats_y + 25)),
+            ]
+            self.car2.ui_dirty = False
+
+        batch.extend(self._p1_stat_lines)
+        batch.extend(self._p2_stat_lines)
+
+        return self.screen.blits(batch, doreturn=1)
 
     async def run(self):
         """Main game loop - MUST be async for Pygbag."""
-        print("🌐 Starting web racing game...")
+        if IS_WEB:
+            print("🌐 Starting web racing game...")
+
+        loop = asyncio.get_running_loop()
+        frame_dt = 1.0 / FPS
+        frame_event = asyncio.Event()
 
         while self.running:
-            # Handle events
-            for event in pygame.event.get():
+            if not IS_WEB:
+                # Schedule the next frame tick up front; the wait at the end
+                # of the loop then covers work time plus idle time with a
+                # single callback instead of repeated scheduler wakeups
+                loop.call_later(frame_dt, frame_event.set)
+
+            # Fetch only the event types this loop acts on instead of
+            # allocating and walking the full event list
+            for event in pygame.event.get((pygame.QUIT, pygame.KEYDOWN)):
                 if event.type == pygame.QUIT:
                     self.running = False
-                elif event.type == pygame.KEYDOWN:
+                else:
                     if event.key == pygame.K_ESCAPE:
                         self.running = False
                     elif event.key == pygame.K_TAB and self.web_settings:
@@ -124,35 +202,77 @@ class RacingGameWeb:
                     if self.web_settings:
                         self.web_settings.handle_event(event)
 
+            # Forward mouse events to the settings panel, drop the rest
+            if self.web_settings:
+                for event in pygame.event.get(
+                    (
+                        pygame.MOUSEBUTTONDOWN,
+                        pygame.MOUSEBUTTONUP,
+                        pygame.MOUSEMOTION,
+                    )
+                ):
+                    self.web_settings.handle_event(event)
+            pygame.event.clear()
+
             # Get key states
             keys = pygame.key.get_pressed()
 
             # Update cars
-            self.car1.update(keys, PLAYER1_CONTROLS, self.track)
-            self.car2.update(keys, PLAYER2_CONTROLS, self.track)
+            self.car1.update(keys, PLAYER1_KEYS, self.track)
+            self.car2.update(keys, PLAYER2_KEYS, self.track)
 
             # Render
-            self.screen.fill(COLORS["BLACK"])
-            self.track.render(self.screen)
-            self.car1.render(self.screen)
-            self.car2.render(self.screen)
-            self.render_ui()
-
+            self.screen.blit(self._background, (0, 0))
+            dirty_rects = [
+                self.car1.render(self.screen),
+                self.car2.render(self.screen),
+            ]
+            ui_rects = self.render_ui()
+
+            settings_visible = bool(
+                self.web_settings and self.web_settings.is_visible()
+            )
             if self.web_settings:
                 self.web_settings.render()
 
-            pygame.display.flip()
-            self.clock.tick(FPS)
-
-            # CRITICAL: This yield is required for Pygbag
-            await asyncio.sleep(0)
+            # Present only the regions that changed. A full flip covers the
+            # first frame and the frames where the settings overlay is shown
+            # or was just dismissed.
+            if self._needs_full_flip or settings_visible or self._settings_was_visible:
+                pygame.display.flip()
+                self._needs_full_flip = False
+            else:
+                pygame.display.update(
+                    dirty_rects + self._prev_dirty_rects
+                    + ui_rects + self._prev_ui_rects
+                )
+            self._prev_dirty_rects = dirty_rects
+            self._prev_ui_rects = ui_rects
+            self._settings_was_visible = settings_visible
+
+            if IS_WEB:
+                # The browser already paces frames via requestAnimationFrame;
+                # a bare yield hands control back to it without adding a
+                # software delay on top of its vsync
+                await asyncio.sleep(0)
+            else:
+                # Native: block until the tick scheduled at the top of the
+                # frame fires. One call_later per frame paces the loop with
+                # no polling and no blocking clock.tick() spin.
+                await frame_event.wait()
+                frame_event.clear()
 
         pygame.quit()
         print("👋 Web game finished!")
 
 
+async def main():
+    """Async entry point - launchers can await this instead of running the module."""
+    game = RacingGameWeb()
+    await game.run()
+
+
 # Legacy support - only run if this file is executed directly
 if __name__ == "__main__":
-    # This will only run if main_web.py is called directly (not through universal launcher)
-    game = RacingGameWeb()
-    asyncio.run(game.run())
+    # This will only run if main.py is called directly (not through a launcher)
+    asyncio.run(main())
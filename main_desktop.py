@@ -5,13 +5,15 @@ This module initializes Pygame, creates the game window, instantiates the track
 and cars, and contains the main game loop with event handling and rendering.
 """
 
+import math
 import sys
 from typing import Dict, List
 
 import pygame
+import pygame.freetype
 
 from car import Car
-from controls import PLAYER1_CONTROLS, PLAYER2_CONTROLS
+from controls import PLAYER1_KEYS, PLAYER2_KEYS
 from game_settings import game_settings
 from settings import (
     COLORS,
@@ -45,14 +47,52 @@ class RacingGame:
         # Initialize clock for FPS control
         self.clock: pygame.time.Clock = pygame.time.Clock()
 
+        # UI font, created once; every HUD line renders through it into
+        # surfaces held in _text_cache below. Freetype size 17 matches
+        # the metrics of the old pygame.font.Font(None, 24).
+        self._ui_font: pygame.freetype.Font = pygame.freetype.Font(None, 17)
+
+        # Rendered-text cache keyed by (text, color). Stat strings repeat
+        # heavily frame to frame (speeds are shown to one decimal), so
+        # most frames blit cached surfaces instead of rasterizing glyphs.
+        self._text_cache: Dict[tuple, pygame.Surface] = {}
+
+        # Static HUD instruction lines, built once
+        self._info_lines: List[str] = [
+            "🎮 2D Racing Game",
+            "Player 1: WASD | Player 2: Arrow Keys",
+            "TAB: Settings Menu | ESC: Quit",
+        ]
+
         # Initialize game objects
         self.track: Track = Track()
         self.cars: List[Car] = []
         self.running: bool = True
 
+        # Dirty-rect bookkeeping: push only the regions that changed instead of
+        # flipping the whole framebuffer every frame
+        self._needs_full_flip: bool = True
+        self._prev_dirty_rects: List[pygame.Rect] = []
+        self._hud_rect: pygame.Rect = pygame.Rect(0, 0, 420, 290)
+
+        # Bind the control tuples locally so the per-frame update path
+        # avoids module-global lookups
+        self._p1_keys = PLAYER1_KEYS
+        self._p2_keys = PLAYER2_KEYS
+
         # Load track and create cars
         self._initialize_game()
 
+        # Pre-composite the static background (clear color + track) once,
+        # in the display's pixel format, so the per-frame render replaces
+        # a fill plus a track blit with a single copy
+        self._background: pygame.Surface = pygame.Surface(
+            (SCREEN_WIDTH, SCREEN_HEIGHT)
+        )
+        self._background.fill(COLORS["BLACK"])
+        self.track.render(self._background)
+        self._background = self._background.convert()
+
     def _initialize_game(self) -> None:
         """Initialize the track and cars."""
         # Load the track
@@ -88,58 +128,62 @@ class RacingGame:
 
     def _handle_events(self) -> None:
         """Handle pygame events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
+        # Fetch only QUIT events - the only type this loop acts on - and
+        # drop everything else instead of walking the full event list
+        for event in pygame.event.get(pygame.QUIT):
+            self.running = False
+        pygame.event.clear()
 
         # Get currently pressed keys for continuous movement
         keys_pressed = pygame.key.get_pressed()
 
         # Update cars with continuous key presses
         if len(self.cars) > 0:
-            self.cars[0].update(keys_pressed, PLAYER1_CONTROLS, self.track)
+            self.cars[0].update(keys_pressed, self._p1_keys, self.track)
         if len(self.cars) > 1:
-            self.cars[1].update(keys_pressed, PLAYER2_CONTROLS, self.track)
+            self.cars[1].update(keys_pressed, self._p2_keys, self.track)
 
     def _render(self) -> None:
         """Render all game objects to the screen."""
-        # Clear screen
-        self.screen.fill(COLORS["BLACK"])
-
-        # Render track
-        self.track.render(self.screen)
+        # Clear screen and track in one pre-composited blit
+        self.screen.blit(self._background, (0, 0))
 
-        # Render cars
-        for car in self.cars:
-            car.render(self.screen)
+        # Render cars, collecting the regions they touch this frame
+        dirty_rects = [car.render(self.screen) for car in self.cars]
 
         # Render UI information
         self._render_ui()
 
-        # Update display
-        pygame.display.flip()
+        # Update display: full flip on the first frame, dirty rects afterwards.
+        # Old and new car positions plus the HUD cover everything that changed.
+        if self._needs_full_flip:
+            pygame.display.flip()
+            self._needs_full_flip = False
+        else:
+            pygame.display.update(dirty_rects + self._prev_dirty_rects + [self._hud_rect])
+        self._prev_dirty_rects = dirty_rects
+
+    def _stat_surface(self, text: str, color: pygame.Color) -> pygame.Surface:
+        """Get the rendered surface for a stat line, rasterizing on miss."""
+        key = (text, tuple(color))
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface, _ = self._ui_font.render(text, color)
+            self._text_cache[key] = surface
+        return surface
 
     def _render_ui(self) -> None:
         """Render user interface elements."""
-        font = pygame.font.Font(None, 24)
-
         # Game info
-        info_lines = [
-            "🎮 2D Racing Game",
-            "Player 1: WASD | Player 2: Arrow Keys",
-            "TAB: Settings Menu | ESC: Quit",
-        ]
-
-        for i, line in enumerate(info_lines):
-            text_surface = font.render(line, True, COLORS["WHITE"])
-            self.screen.blit(text_surface, (10, 10 + i * 25))
+        for i, line in enumerate(self._info_lines):
+            self.screen.blit(
+                self._stat_surface(line, COLORS["WHITE"]), (10, 10 + i * 25)
+            )
 
         # Show current car stats
         if len(self.cars) > 0:
             car = self.cars[0]
-            import math
-
-            current_speed = math.sqrt(car.velocity_x**2 + car.velocity_y**2)
+            current_speed = math.hypot(car.velocity_x, car.velocity_y)
             stats_text = [
                 f"P1 Speed: {current_speed:.1f}/{car.max_speed:.1f}",
                 f"P1 Turn: {car.turn_speed:.1f}",
@@ -151,15 +195,12 @@ class RacingGame:
                     color = COLORS["RED"]
                 else:
                     color = COLORS["YELLOW"]
-                text_surface = font.render(stat, True, color)
-                self.screen.blit(text_surface, (10, 100 + i * 25))
+                self.screen.blit(self._stat_surface(stat, color), (10, 100 + i * 25))
 
         # Show Player 2 stats
         if len(self.cars) > 1:
             car2 = self.cars[1]
-            import math
-
-            current_speed2 = math.sqrt(car2.velocity_x**2 + car2.velocity_y**2)
+            current_speed2 = math.hypot(car2.velocity_x, car2.velocity_y)
             stats_text = [
                 f"P2 Speed: {current_speed2:.1f}/{car2.max_speed:.1f}",
                 f"P2 Turn: {car2.turn_speed:.1f}",
@@ -171,8 +212,7 @@ class RacingGame:
                     color = COLORS["RED"]
                 else:
                     color = COLORS["BLUE"]
-                text_surface = font.render(stat, True, color)
-                self.screen.blit(text_surface, (10, 200 + i * 25))
+                self.screen.blit(self._stat_surface(stat, color), (10, 200 + i * 25))
 
     def run(self) -> None:
         """Run the main game loop."""
@@ -180,12 +220,13 @@ class RacingGame:
         print("🎮 Controls: Player 1 (WASD) | Player 2 (Arrow Keys)")
         print("TAB: Settings Menu | ESC: Quit")
 
-        # Start the settings interface thread
+        # Put the settings interface terminal UI up (runs in this loop)
         settings_interface.start()
 
         try:
             while self.running:
                 self._handle_events()
+                settings_interface.tick()
                 self._render()
                 self.clock.tick(FPS)
         except KeyboardInterrupt:
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Local HTTP server for testing the built web version of the racing game.
+
+Serves the Pygbag build output (build/web) so the WASM bundle can be
+loaded in a browser without CORS issues.
+"""
+
+import os
+import socket
+import stat
+import sys
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_PORT = 8000
+SERVE_DIRECTORY = "build/web"
+
+# Asset types the browser may cache between reloads
+CACHEABLE_EXTENSIONS = ('.wasm', '.apk', '.data', '.js', '.png')
+
+
+def find_free_port() -> int:
+    """
+    Ask the kernel for a free port with a single bind.
+
+    Binding port 0 lets the kernel pick an unused ephemeral port
+    atomically instead of probing a port range one bind at a time.
+
+    Returns:
+        int: A port number that was free at bind time
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('localhost', 0))
+        return s.getsockname()[1]
+
+
+class GameHTTPRequestHandler(SimpleHTTPRequestHandler):
+    """Request handler that serves the web build directory."""
+
+    # ETag of the file being served by the current do_GET, if any
+    _current_etag = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=SERVE_DIRECTORY, **kwargs)
+
+    def _file_etag(self, path: str):
+        """
+        Build an ETag from a file's mtime and size (hex-encoded, quoted).
+
+        Returns:
+            The ETag string, or None if path is not a regular file
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        return f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+    def do_GET(self):
+        """Serve a GET request, answering 304 on a matching If-None-Match."""
+        etag = self._file_etag(self.translate_path(self.path))
+        if etag and self.headers.get('If-None-Match') == etag:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        self._current_etag = etag
+        try:
+            super().do_GET()
+        finally:
+            self._current_etag = None
+
+    def end_headers(self):
+        """Attach caching headers before the header block is finished."""
+        if self._current_etag:
+            self.send_header('ETag', self._current_etag)
+            if self.path.split('?', 1)[0].endswith(CACHEABLE_EXTENSIONS):
+                self.send_header('Cache-Control', 'public, max-age=3600')
+        super().end_headers()
+
+    def copyfile(self, source, outputfile):
+        """
+        Copy file data to the socket with os.sendfile when possible.
+
+        Large assets (the multi-MB wasm bundle) then go kernel-to-socket
+        with zero user-space copies instead of 16 KB chunked reads through
+        Python. Sources without a real file descriptor fall back to the
+        base implementation.
+        """
+        try:
+            in_fd = source.fileno()
+            out_fd = outputfile.fileno()
+            size = os.fstat(in_fd).st_size
+        except (AttributeError, OSError, ValueError):
+            super().copyfile(source, outputfile)
+            return
+
+        outputfile.flush()
+        offset = 0
+        while offset < size:
+            try:
+                sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+            except OSError:
+                if offset == 0:
+                    # Nothing sent yet - safe to retry with the chunked copy
+                    super().copyfile(source, outputfile)
+                    return
+                raise
+            if sent == 0:
+                break
+            offset += sent
+
+
+class GameHTTPServer(ThreadingHTTPServer):
+    """
+    Threaded server so the browser's parallel asset requests (wasm, apk,
+    images) are served concurrently instead of one at a time.
+    """
+
+    # Allow immediate restarts without waiting out TIME_WAIT, and let
+    # Ctrl+C exit cleanly without joining in-flight request threads
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+def main() -> None:
+    """Serve the web build on the default port, or a kernel-assigned one."""
+    if not os.path.isdir(SERVE_DIRECTORY):
+        print(f"❌ No web build found at {SERVE_DIRECTORY}/")
+        print("💡 Run 'python dev.py build' first")
+        sys.exit(1)
+
+    port = DEFAULT_PORT
+    try:
+        server = GameHTTPServer(("", port), GameHTTPRequestHandler)
+    except OSError:
+        port = find_free_port()
+        server = GameHTTPServer(("", port), GameHTTPRequestHandler)
+
+    print(f"🌐 Serving {SERVE_DIRECTORY}/ at http://localhost:{port}")
+    print("🛑 Press Ctrl+C to stop")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Server stopped by user")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,10 @@ This module contains all the game configuration including screen dimensions,
 physics parameters, colors, and car statistics presets.
 """
 
-from typing import Dict, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple
+
+import pygame
 
 # Screen and display settings
 SCREEN_WIDTH: int = 1280
@@ -13,16 +16,18 @@ SCREEN_HEIGHT: int = 720
 FPS: int = 60
 WINDOW_TITLE: str = "2D Racing Game"
 
-# Colors (RGB tuples)
-COLORS: Dict[str, Tuple[int, int, int]] = {
-    'BLACK': (0, 0, 0),
-    'WHITE': (255, 255, 255),
-    'RED': (255, 0, 0),
-    'GREEN': (0, 255, 0),
-    'BLUE': (0, 0, 255),
-    'YELLOW': (255, 255, 0),
-    'GRAY': (128, 128, 128),
-}
+# Colors, pre-parsed into pygame.Color objects so fill/render/draw calls
+# skip the per-call tuple conversion in pygame's C layer. The read-only
+# mapping guards against accidental rebinding at runtime.
+COLORS: Mapping[str, pygame.Color] = MappingProxyType({
+    'BLACK': pygame.Color(0, 0, 0),
+    'WHITE': pygame.Color(255, 255, 255),
+    'RED': pygame.Color(255, 0, 0),
+    'GREEN': pygame.Color(0, 255, 0),
+    'BLUE': pygame.Color(0, 0, 255),
+    'YELLOW': pygame.Color(255, 255, 0),
+    'GRAY': pygame.Color(128, 128, 128),
+})
 
 # Track mask colors for collision detection
 TRACK_COLORS: Dict[str, Tuple[int, int, int]] = {
@@ -32,6 +37,16 @@ TRACK_COLORS: Dict[str, Tuple[int, int, int]] = {
     'SLOW_DOWN': (0, 255, 0),        # Green - grass/sand areas
 }
 
+# Integer class IDs for the one-byte-per-pixel collision class map.
+# Keys mirror TRACK_COLORS; callers compare a single int instead of an
+# RGB tuple.
+TRACK_CLASS_IDS: Dict[str, int] = {
+    'TRACK_SURFACE': 0,
+    'WALL': 1,
+    'START_POSITION': 2,
+    'SLOW_DOWN': 3,
+}
+
 # Car physics presets
 SPORTS_CAR: Dict[str, Any] = {
     'acceleration': 0.3,
@@ -5,108 +5,145 @@ This module provides a console-based interface for adjusting game settings
 while the game is running using arrow keys.
 """
 
-import threading
-import time
+import os
 import sys
 import select
 import termios
 import tty
-from typing import Dict, Any, List, Callable
+from collections import namedtuple
+from typing import Any, Dict, List, Set, Tuple
 from game_settings import game_settings
 
 
+# One settings row: bounds, step, accessors, and precomputed display
+# strings. A flat tuple per row keeps rendering and adjustment free of
+# dict lookups.
+Setting = namedtuple('Setting', 'name mn mx inc getter adjust fmt rng')
+
+
 class SettingsInterface:
     """
     Console-based settings interface with arrow key navigation.
     """
-    
+
+    # Terminal row (1-based) of the first settings line; the header
+    # occupies the rows above it
+    _SETTINGS_FIRST_ROW = 5
+
     def __init__(self) -> None:
         """Initialize the settings interface."""
         self.running: bool = False
         self.current_selection: int = 0
         self.cars: List[Any] = []  # Will be set by the main game
         
-        # Settings configuration with realistic friction values
-        self.settings: List[Dict[str, Any]] = [
-            {
-                'name': 'P1 Acceleration',
-                'current_value': lambda: self.cars[0].acceleration if self.cars else 0.3,
-                'adjust': lambda delta: self._adjust_car_setting(0, 'acceleration', delta),
-                'min_value': 0.1,
-                'max_value': 1.0,
-                'increment': 0.05,
-            },
-            {
-                'name': 'P1 Max Speed',
-                'current_value': lambda: self.cars[0].max_speed if self.cars else 8.0,
-                'adjust': lambda delta: self._adjust_car_setting(0, 'max_speed', delta),
-                'min_value': 2.0,
-                'max_value': 15.0,
-                'increment': 0.5,
-            },
-            {
-                'name': 'P1 Turn Speed',
-                'current_value': lambda: self.cars[0].turn_speed if self.cars else 4.0,
-                'adjust': lambda delta: self._adjust_car_setting(0, 'turn_speed', delta),
-                'min_value': 1.0,
-                'max_value': 8.0,
-                'increment': 0.2,
-            },
-            {
-                'name': 'P1 Friction',
-                'current_value': lambda: self._get_friction_display(0),
-                'adjust': lambda delta: self._adjust_car_friction(0, delta),
-                'min_value': 0.01,
-                'max_value': 0.20,
-                'increment': 0.01,
-            },
-            {
-                'name': 'P2 Acceleration',
-                'current_value': lambda: self.cars[1].acceleration if len(self.cars) > 1 else 0.2,
-                'adjust': lambda delta: self._adjust_car_setting(1, 'acceleration', delta),
-                'min_value': 0.1,
-                'max_value': 1.0,
-                'increment': 0.05,
-            },
-            {
-                'name': 'P2 Max Speed',
-                'current_value': lambda: self.cars[1].max_speed if len(self.cars) > 1 else 6.0,
-                'adjust': lambda delta: self._adjust_car_setting(1, 'max_speed', delta),
-                'min_value': 2.0,
-                'max_value': 15.0,
-                'increment': 0.5,
-            },
-            {
-                'name': 'P2 Turn Speed',
-                'current_value': lambda: self.cars[1].turn_speed if len(self.cars) > 1 else 2.5,
-                'adjust': lambda delta: self._adjust_car_setting(1, 'turn_speed', delta),
-                'min_value': 1.0,
-                'max_value': 8.0,
-                'increment': 0.2,
-            },
-            {
-                'name': 'P2 Friction',
-                'current_value': lambda: self._get_friction_display(1),
-                'adjust': lambda delta: self._adjust_car_friction(1, delta),
-                'min_value': 0.01,
-                'max_value': 0.20,
-                'increment': 0.01,
-            },
-            {
-                'name': 'Wall Stickiness',
-                'current_value': lambda: game_settings.wall_stickiness,
-                'adjust': lambda delta: self._adjust_global_setting('wall_stickiness', delta),
-                'min_value': 0.0,
-                'max_value': 1.0,
-                'increment': 0.1,
-            },
+        # Settings table with realistic friction values. Flat namedtuple
+        # rows (SoA-style) instead of dicts of lambdas: bounds, formats,
+        # and range strings are plain fields resolved at construction.
+        self.settings: List[Setting] = [
+            Setting(
+                'P1 Acceleration', 0.1, 1.0, 0.05,
+                lambda: self.cars[0].acceleration if self.cars else 0.3,
+                lambda delta: self._adjust_car_setting(0, 'acceleration', delta),
+                '{:.2f}', '[0.1-1.0]',
+            ),
+            Setting(
+                'P1 Max Speed', 2.0, 15.0, 0.5,
+                lambda: self.cars[0].max_speed if self.cars else 8.0,
+                lambda delta: self._adjust_car_setting(0, 'max_speed', delta),
+                '{:.2f}', '[2.0-15.0]',
+            ),
+            Setting(
+                'P1 Turn Speed', 1.0, 8.0, 0.2,
+                lambda: self.cars[0].turn_speed if self.cars else 4.0,
+                lambda delta: self._adjust_car_setting(0, 'turn_speed', delta),
+                '{:.2f}', '[1.0-8.0]',
+            ),
+            Setting(
+                'P1 Friction', 0.01, 0.20, 0.01,
+                lambda: self._get_friction_display(0),
+                lambda delta: self._adjust_car_friction(0, delta),
+                '{:.3f}', '[0.01-0.20]',
+            ),
+            Setting(
+                'P2 Acceleration', 0.1, 1.0, 0.05,
+                lambda: self.cars[1].acceleration if len(self.cars) > 1 else 0.2,
+                lambda delta: self._adjust_car_setting(1, 'acceleration', delta),
+                '{:.2f}', '[0.1-1.0]',
+            ),
+            Setting(
+                'P2 Max Speed', 2.0, 15.0, 0.5,
+                lambda: self.cars[1].max_speed if len(self.cars) > 1 else 6.0,
+                lambda delta: self._adjust_car_setting(1, 'max_speed', delta),
+                '{:.2f}', '[2.0-15.0]',
+            ),
+            Setting(
+                'P2 Turn Speed', 1.0, 8.0, 0.2,
+                lambda: self.cars[1].turn_speed if len(self.cars) > 1 else 2.5,
+                lambda delta: self._adjust_car_setting(1, 'turn_speed', delta),
+                '{:.2f}', '[1.0-8.0]',
+            ),
+            Setting(
+                'P2 Friction', 0.01, 0.20, 0.01,
+                lambda: self._get_friction_display(1),
+                lambda delta: self._adjust_car_friction(1, delta),
+                '{:.3f}', '[0.01-0.20]',
+            ),
+            Setting(
+                'Wall Stickiness', 0.0, 1.0, 0.1,
+                lambda: game_settings.wall_stickiness,
+                lambda delta: self._adjust_global_setting('wall_stickiness', delta),
+                '{:.2f}', '[0.0-1.0]',
+            ),
         ]
         
+        # Per-row line templates with a single {val} placeholder. Name,
+        # alignment, ANSI colors, and the range string never change, so
+        # they are baked in here and rendering does one substitution.
+        self._tpl_normal: List[str] = [
+            f"  {s.name:<16}: {{val:>6}} {s.rng}" for s in self.settings
+        ]
+        self._tpl_selected: List[str] = [
+            f"→ \033[93m{s.name:<16}\033[0m: \033[92m{{val:>6}}\033[0m {s.rng}"
+            for s in self.settings
+        ]
+
+        # O(1) bounds lookup for keypress adjustment, derived from the car
+        # rows above: 'P1 Max Speed' -> (0, 'max_speed'), etc. Friction and
+        # global rows go through their own adjust paths. Row-index maps are
+        # built alongside so the adjust paths can flag their row as dirty.
+        self._bounds: Dict[Tuple[int, str], Tuple[float, float]] = {}
+        self._attr_rows: Dict[Tuple[int, str], int] = {}
+        self._friction_rows: Dict[int, int] = {}
+        self._global_rows: Dict[str, int] = {}
+        for i, row in enumerate(self.settings):
+            if row.name.startswith('P') and 'Friction' not in row.name:
+                car_index = 0 if row.name.startswith('P1') else 1
+                attr = row.name[3:].lower().replace(' ', '_')
+                self._bounds[(car_index, attr)] = (row.mn, row.mx)
+                self._attr_rows[(car_index, attr)] = i
+            elif row.name.endswith('Friction'):
+                self._friction_rows[0 if row.name.startswith('P1') else 1] = i
+            else:
+                self._global_rows[row.name.lower().replace(' ', '_')] = i
+
+        # Rows whose displayed value may have changed since the last
+        # redraw; the renderer re-queries getters only for these
+        self._dirty: Set[int] = set(range(len(self.settings)))
+
         # Store friction display values (realistic physics)
         self.friction_display = [0.05, 0.07]  # P1: 0.05 (sporty), P2: 0.07 (stable)
         
         # Terminal settings for raw input
         self.old_settings = None
+
+        # Bytes read from the tty but not yet handed out as keys: one
+        # read can pick up several queued keypresses, and later _get_key
+        # calls drain this before touching the fd again
+        self._pending: str = ''
+
+        # Differential renderer state: the last emitted string per row.
+        # Rows are only rewritten when their rendered content changes.
+        self._prev_lines: List[str] = []
         
     def set_cars(self, cars: List[Any]) -> None:
         """
@@ -118,13 +155,17 @@ class SettingsInterface:
         self.cars = cars
     
     def start(self) -> None:
-        """Start the settings interface in a separate thread."""
+        """Put the terminal in raw mode and draw the initial frame."""
+        try:
+            self._setup_terminal()
+        except (termios.error, OSError):
+            # No usable tty (e.g. piped stdin) - leave the interface off
+            return
         self.running = True
-        self.interface_thread = threading.Thread(target=self._run_interface, daemon=True)
-        self.interface_thread.start()
-    
+        self._display_interface()
+
     def stop(self) -> None:
-        """Stop the settings interface."""
+        """Stop the settings interface and restore the terminal."""
         self.running = False
         if self.old_settings:
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
@@ -140,16 +181,31 @@ class SettingsInterface:
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
     
     def _get_key(self) -> str:
-        """Get a single keypress from stdin."""
+        """
+        Return a pending keypress without blocking, or '' if none.
+
+        A zero-timeout select makes this safe to call once per frame from
+        the game loop: when no key is waiting it costs a single syscall.
+        The raw fd is read directly, so a full escape sequence arrives in
+        one chunk while a bare ESC press returns just its single byte
+        instead of blocking until more input shows up. A read can also
+        pick up several queued keys at once (held-key auto-repeat across
+        a slow frame, pasted input); the surplus goes into _pending so
+        each call hands back exactly one key and none are dropped.
+        """
+        data = self._pending
         try:
-            if select.select([sys.stdin], [], [], 0.1) == ([sys.stdin], [], []):
-                key = sys.stdin.read(1)
-                if key == '\x1b':  # ESC sequence
-                    key += sys.stdin.read(2)
-                return key
+            if not data and select.select([sys.stdin], [], [], 0) == ([sys.stdin], [], []):
+                data = os.read(sys.stdin.fileno(), 64).decode(errors='replace')
         except:
             pass
-        return ''
+        if not data:
+            return ''
+        if data.startswith('\x1b') and len(data) >= 3 and data[1] == '[':
+            key, self._pending = data[:3], data[3:]
+        else:
+            key, self._pending = data[0], data[1:]
+        return key
     
     def _get_friction_display(self, car_index: int) -> float:
         """
@@ -180,17 +236,17 @@ class SettingsInterface:
         # Get friction setting configuration
         friction_config = None
         for config in self.settings:
-            if ((car_index == 0 and config['name'] == 'P1 Friction') or
-                (car_index == 1 and config['name'] == 'P2 Friction')):
+            if ((car_index == 0 and config.name == 'P1 Friction') or
+                (car_index == 1 and config.name == 'P2 Friction')):
                 friction_config = config
                 break
-        
+
         if friction_config:
             # Update display value
             current_value = self.friction_display[car_index]
             new_value = current_value + delta
-            new_value = max(friction_config['min_value'], 
-                          min(friction_config['max_value'], new_value))
+            new_value = max(friction_config.mn,
+                          min(friction_config.mx, new_value))
             self.friction_display[car_index] = new_value
             
             # Convert to car friction (lower friction value = higher velocity retention)
@@ -200,6 +256,8 @@ class SettingsInterface:
             if car_index < len(self.cars):
                 car = self.cars[car_index]
                 setattr(car, 'friction', car_friction)
+
+            self._dirty.add(self._friction_rows[car_index])
     
     def _adjust_car_setting(self, car_index: int, setting: str, delta: float) -> None:
         """
@@ -212,27 +270,23 @@ class SettingsInterface:
         """
         if car_index < len(self.cars):
             car = self.cars[car_index]
-            current_value = getattr(car, setting)
-            new_value = current_value + delta
-            
-            # Apply bounds based on setting configuration
-            setting_config = None
-            for config in self.settings:
-                if ((car_index == 0 and config['name'].startswith('P1') and setting in config['name'].lower()) or
-                    (car_index == 1 and config['name'].startswith('P2') and setting in config['name'].lower())):
-                    if setting.replace('_', ' ').lower() in config['name'].lower():
-                        setting_config = config
-                        break
-            
-            if setting_config:
-                new_value = max(setting_config['min_value'], 
-                              min(setting_config['max_value'], new_value))
-            
+            new_value = getattr(car, setting) + delta
+
+            # Apply bounds via the precomputed map - one hash lookup
+            # instead of a string search over the settings table
+            bounds = self._bounds.get((car_index, setting))
+            if bounds:
+                new_value = max(bounds[0], min(bounds[1], new_value))
+
             setattr(car, setting, new_value)
-            
+
             # Also update current_max_speed if max_speed changed
             if setting == 'max_speed':
                 car.current_max_speed = new_value
+
+            row = self._attr_rows.get((car_index, setting))
+            if row is not None:
+                self._dirty.add(row)
     
     def _adjust_global_setting(self, setting: str, delta: float) -> None:
         """
@@ -246,87 +300,124 @@ class SettingsInterface:
             current_value = game_settings.wall_stickiness
             new_value = max(0.0, min(1.0, current_value + delta))
             game_settings.wall_stickiness = new_value
+
+        row = self._global_rows.get(setting)
+        if row is not None:
+            self._dirty.add(row)
     
     def _clear_screen(self) -> None:
         """Clear the console screen."""
         print('\033[2J\033[H', end='', flush=True)
     
+    def _build_line(self, index: int, setting: Setting) -> str:
+        """
+        Format a single settings row (pure formatting, no cursor movement).
+
+        Args:
+            index: Row index into self.settings
+            setting: The settings row to format
+
+        Returns:
+            The rendered line including selection highlight
+        """
+        # Get current value; fmt was fixed per row at construction
+        try:
+            value_str = setting.fmt.format(setting.getter())
+        except:
+            value_str = "N/A"
+
+        # Everything but the value was baked into the row template
+        templates = (
+            self._tpl_selected if index == self.current_selection
+            else self._tpl_normal
+        )
+        return templates[index].format(val=value_str)
+
+    def _display_header(self) -> None:
+        """Draw the full static frame in one write and reset the row cache."""
+        # Clear, header, reserved settings rows, footer - assembled into a
+        # single buffer so the whole frame is one write() syscall
+        parts = [
+            '\033[2J\033[H',
+            '\r🎮 RACING GAME - SETTINGS INTERFACE\n',
+            '\r' + '=' * 60 + '\n',
+            "\rNavigation: ↑/↓ select, ←/→ adjust, 'q' quit\n",
+            '\r\n',
+        ]
+        parts.extend('\r\n' for _ in self.settings)
+        parts.append('\r\n')
+        parts.append('\r' + '=' * 60 + '\n')
+        parts.append('\rGame: WASD (P1), Arrows (P2) | Changes apply instantly!\n')
+
+        sys.stdout.write(''.join(parts))
+        sys.stdout.flush()
+
+        self._prev_lines = [''] * len(self.settings)
+
     def _display_interface(self) -> None:
-        """Display the settings interface with proper formatting."""
-        self._clear_screen()
-        
-        # Header with proper carriage returns
-        print("\r🎮 RACING GAME - SETTINGS INTERFACE")
-        print("\r" + "=" * 60)
-        print("\rNavigation: ↑/↓ select, ←/→ adjust, 'q' quit")
-        print("\r")
-        
-        for i, setting in enumerate(self.settings):
-            # Selection indicator
-            indicator = "→ " if i == self.current_selection else "  "
-            
-            # Get current value
-            try:
-                current_val = setting['current_value']()
-                if setting['name'] in ['P1 Friction', 'P2 Friction']:
-                    value_str = f"{current_val:.3f}"
-                else:
-                    value_str = f"{current_val:.2f}"
-            except:
-                value_str = "N/A"
-            
-            # Display range
-            if setting['name'] in ['P1 Friction', 'P2 Friction']:
-                range_str = f"[{setting['min_value']:.2f}-{setting['max_value']:.2f}]"
-            else:
-                range_str = f"[{setting['min_value']:.1f}-{setting['max_value']:.1f}]"
-            
-            # Format line with proper alignment and carriage return
-            name_field = f"{setting['name']:<16}"
-            value_field = f"{value_str:>6}"
-            
-            # Color coding for selected item
-            if i == self.current_selection:
-                line = f"\r{indicator}\033[93m{name_field}\033[0m: \033[92m{value_field}\033[0m {range_str}"
-            else:
-                line = f"\r{indicator}{name_field}: {value_field} {range_str}"
-            
-            print(line)
-        
-        print("\r")
-        print("\r" + "=" * 60)
-        print("\rGame: WASD (P1), Arrows (P2) | Changes apply instantly!")
+        """
+        Redraw only the rows whose rendered content actually changed.
+
+        When idle this emits nothing at all; a value change or selection
+        move rewrites one or two rows, and all changed rows for a frame go
+        out in a single buffered write instead of one per print call.
+        """
+        if len(self._prev_lines) != len(self.settings):
+            self._display_header()
+            self._dirty = set(range(len(self.settings)))
+
+        if not self._dirty:
+            return
+
+        parts = []
+        for i in sorted(self._dirty):
+            line = self._build_line(i, self.settings[i])
+            if line != self._prev_lines[i]:
+                # Address the row directly, clear it, and rewrite it
+                row = self._SETTINGS_FIRST_ROW + i
+                parts.append(f"\033[{row};1H\033[2K{line}")
+                self._prev_lines[i] = line
+        self._dirty.clear()
+
+        if parts:
+            sys.stdout.write(''.join(parts))
+            sys.stdout.flush()
     
-    def _run_interface(self) -> None:
-        """Main interface loop."""
-        try:
-            self._setup_terminal()
-            
-            while self.running:
-                self._display_interface()
-                
-                key = self._get_key()
-                
-                if key == 'q' or key == '\x03':  # 'q' or Ctrl+C
-                    break
-                elif key == '\x1b[A':  # Up arrow
-                    self.current_selection = (self.current_selection - 1) % len(self.settings)
-                elif key == '\x1b[B':  # Down arrow
-                    self.current_selection = (self.current_selection + 1) % len(self.settings)
-                elif key == '\x1b[D':  # Left arrow (decrease)
-                    setting = self.settings[self.current_selection]
-                    setting['adjust'](-setting['increment'])
-                elif key == '\x1b[C':  # Right arrow (increase)
-                    setting = self.settings[self.current_selection]
-                    setting['adjust'](setting['increment'])
-                
-                time.sleep(0.05)  # Small delay to prevent excessive CPU usage
-                
-        except KeyboardInterrupt:
-            pass
-        finally:
-            self._restore_terminal()
-            self.running = False
+    def tick(self) -> None:
+        """
+        Process at most one pending keypress and redraw if it changed
+        anything.
+
+        Called once per frame from the game loop; keys arrive at human
+        speed, so a 60 Hz poll loses no responsiveness while avoiding a
+        separate thread contending for the GIL.
+        """
+        if not self.running:
+            return
+
+        key = self._get_key()
+        if not key:
+            return
+
+        if key == 'q' or key == '\x03':  # 'q' or Ctrl+C
+            self.stop()
+            return
+        elif key == '\x1b[A':  # Up arrow
+            self._dirty.add(self.current_selection)
+            self.current_selection = (self.current_selection - 1) % len(self.settings)
+            self._dirty.add(self.current_selection)
+        elif key == '\x1b[B':  # Down arrow
+            self._dirty.add(self.current_selection)
+            self.current_selection = (self.current_selection + 1) % len(self.settings)
+            self._dirty.add(self.current_selection)
+        elif key == '\x1b[D':  # Left arrow (decrease)
+            setting = self.settings[self.current_selection]
+            setting.adjust(-setting.inc)
+        elif key == '\x1b[C':  # Right arrow (increase)
+            setting = self.settings[self.current_selection]
+            setting.adjust(setting.inc)
+
+        self._display_interface()
     
     def is_running(self) -> bool:
         """Check if the interface is running."""
@@ -3,6 +3,7 @@
 Test script to verify all game components work correctly.
 """
 
+import os
 import sys
 import pygame
 
@@ -11,13 +12,28 @@ pygame.init()
 
 try:
     # Test importing all modules
-    from settings import SPORTS_CAR, TRUCK, TRACK_COLORS
+    from settings import SPORTS_CAR, TRUCK, TRACK_COLORS, TRACK_FILES
     from controls import PLAYER1_CONTROLS, PLAYER2_CONTROLS
     from track import Track
     from car import Car
-    
+
     print("✓ All modules imported successfully")
-    
+
+    # Test that the image assets are present - one directory scan instead
+    # of a stat call per file
+    required_assets = [
+        TRACK_FILES['visual'],
+        TRACK_FILES['mask'],
+        SPORTS_CAR['image_path'],
+        TRUCK['image_path'],
+    ]
+    present = {entry.name for entry in os.scandir('.')}
+    missing = [asset for asset in required_assets if asset not in present]
+    if missing:
+        print(f"❌ Missing game assets: {missing}")
+        sys.exit(1)
+    print(f"✓ All {len(required_assets)} game assets present")
+
     # Test track creation
     track = Track()
     track._create_fallback_track()
@@ -7,7 +7,24 @@ and starting positions for the racing game.
 
 from typing import List, Tuple, Optional
 import pygame
-from settings import TRACK_FILES, TRACK_COLORS, SCREEN_WIDTH, SCREEN_HEIGHT
+from settings import (
+    TRACK_FILES, TRACK_COLORS, TRACK_CLASS_IDS, SCREEN_WIDTH, SCREEN_HEIGHT
+)
+
+try:
+    import numpy as np
+    import pygame.surfarray
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# RGB -> class ID, for classifying colors that come from the get_at
+# fallback path. Off-palette pixels count as plain track surface, the
+# same way the old tuple comparisons treated them.
+_COLOR_TO_CLASS = {
+    TRACK_COLORS[name]: cid for name, cid in TRACK_CLASS_IDS.items()
+}
 
 
 class Track:
@@ -25,6 +42,18 @@ class Track:
         self.mask_surface: Optional[pygame.Surface] = None
         self.start_positions: List[Tuple[int, int]] = []
         self.track_loaded: bool = False
+
+        # Frozen copy handed to callers; built once after the positions
+        # are known so get_start_positions allocates nothing per call
+        self._start_positions_tuple: Tuple[Tuple[int, int], ...] = ()
+
+        # Pixel-array copy of the mask for collision lookups: plain array
+        # indexing, no SDL surface lock or Color allocation per query
+        self._mask_array: Optional['np.ndarray'] = None
+
+        # One-byte-per-pixel class map (TRACK_CLASS_IDS) derived from the
+        # mask, so hot collision queries compare a single int
+        self._class_map: Optional['np.ndarray'] = None
         
     def load_track(self) -> bool:
         """
@@ -45,9 +74,18 @@ class Track:
             self.mask_surface = pygame.transform.scale(
                 self.mask_surface, (SCREEN_WIDTH, SCREEN_HEIGHT)
             )
-            
+
+            # Match the display pixel format so per-frame blits are plain
+            # copies instead of per-pixel conversions (only possible once
+            # a display mode exists). The mask is never blitted and its
+            # exact palette colors must survive for collision
+            # classification, so leave it in its loaded format.
+            if pygame.display.get_surface() is not None:
+                self.visual_surface = self.visual_surface.convert()
+
             # Find start positions from blue pixels
             self._find_start_positions()
+            self._cache_mask_array()
             self.track_loaded = True
             return True
             
@@ -90,34 +128,75 @@ class Track:
         # Draw start positions on mask
         for pos in self.start_positions:
             pygame.draw.circle(self.mask_surface, TRACK_COLORS['START_POSITION'], pos, 5)
+
+        self._start_positions_tuple = tuple(self.start_positions)
         
+        # Match the display pixel format for fast per-frame blits (the
+        # mask is only read for collisions, so it stays unconverted)
+        if pygame.display.get_surface() is not None:
+            self.visual_surface = self.visual_surface.convert()
+
+        self._cache_mask_array()
         self.track_loaded = True
         print("Fallback track created successfully!")
     
+    def _cache_mask_array(self) -> None:
+        """Copy the mask pixels into an array for lock-free collision reads."""
+        if HAS_NUMPY and self.mask_surface is not None:
+            # array3d is a copy, so later reads never touch the SDL lock
+            arr = pygame.surfarray.array3d(self.mask_surface)
+            self._mask_array = arr
+
+            # Classify every pixel once; off-palette pixels stay at the
+            # TRACK_SURFACE default, matching the old tuple comparisons
+            class_map = np.full(
+                arr.shape[:2], TRACK_CLASS_IDS['TRACK_SURFACE'], np.uint8
+            )
+            for name, cid in TRACK_CLASS_IDS.items():
+                r, g, b = TRACK_COLORS[name]
+                match = (
+                    (arr[:, :, 0] == r)
+                    & (arr[:, :, 1] == g)
+                    & (arr[:, :, 2] == b)
+                )
+                class_map[match] = cid
+            self._class_map = class_map
+
     def _find_start_positions(self) -> None:
         """Find all blue pixels (start positions) on the mask image."""
         self.start_positions = []
-        
+
         if self.mask_surface is None:
             return
-        
-        # Scan the mask surface for blue pixels
-        for x in range(self.mask_surface.get_width()):
-            for y in range(self.mask_surface.get_height()):
-                pixel_color = self.mask_surface.get_at((x, y))[:3]  # Get RGB, ignore alpha
-                if pixel_color == TRACK_COLORS['START_POSITION']:
-                    self.start_positions.append((x, y))
-        
+
+        if HAS_NUMPY:
+            # One vectorized pass over a pixel array copy instead of a
+            # Python-level get_at call for every pixel on the mask
+            arr = pygame.surfarray.array3d(self.mask_surface)
+            r, g, b = TRACK_COLORS['START_POSITION']
+            mask = (arr[:, :, 0] == r) & (arr[:, :, 1] == g) & (arr[:, :, 2] == b)
+            xs, ys = np.nonzero(mask)
+            self.start_positions = list(zip(xs.tolist(), ys.tolist()))
+        else:
+            # Scan the mask surface for blue pixels
+            for x in range(self.mask_surface.get_width()):
+                for y in range(self.mask_surface.get_height()):
+                    pixel_color = self.mask_surface.get_at((x, y))[:3]  # Get RGB, ignore alpha
+                    if pixel_color == TRACK_COLORS['START_POSITION']:
+                        self.start_positions.append((x, y))
+
+        self._start_positions_tuple = tuple(self.start_positions)
         print(f"Found {len(self.start_positions)} start positions: {self.start_positions}")
     
-    def get_start_positions(self) -> List[Tuple[int, int]]:
+    def get_start_positions(self) -> Tuple[Tuple[int, int], ...]:
         """
-        Get the list of starting positions for cars.
-        
+        Get the starting positions for cars.
+
         Returns:
-            List of (x, y) coordinates for car starting positions
+            Read-only tuple of (x, y) coordinates for car starting
+            positions (no per-call copy)
         """
-        return self.start_positions.copy()
+        return self._start_positions_tuple
     
     def check_collision(self, x: int, y: int) -> Tuple[int, int, int]:
         """
@@ -130,14 +209,46 @@ class Track:
         Returns:
             RGB color tuple representing the surface type
         """
-        if (self.mask_surface is None or 
+        # Fast path: index the cached pixel array directly
+        if self._mask_array is not None:
+            if (0 <= x < self._mask_array.shape[0] and
+                    0 <= y < self._mask_array.shape[1]):
+                pixel = self._mask_array[x, y]
+                return (int(pixel[0]), int(pixel[1]), int(pixel[2]))
+            return TRACK_COLORS['WALL']  # Out of bounds is treated as wall
+
+        if (self.mask_surface is None or
             x < 0 or x >= self.mask_surface.get_width() or
             y < 0 or y >= self.mask_surface.get_height()):
             return TRACK_COLORS['WALL']  # Out of bounds is treated as wall
-        
-        pixel_color = self.mask_surface.get_at((int(x), int(y)))[:3]  # Get RGB
+
+        # Callers pass ints (the signature requires it), so no coercion here
+        pixel_color = self.mask_surface.get_at((x, y))[:3]  # Get RGB
         return pixel_color
     
+    def check_collision_class(self, x: int, y: int) -> int:
+        """
+        Check what class of surface is at the given coordinates.
+
+        Args:
+            x: X coordinate to check
+            y: Y coordinate to check
+
+        Returns:
+            A TRACK_CLASS_IDS value for the surface type
+        """
+        if self._class_map is not None:
+            if (0 <= x < self._class_map.shape[0] and
+                    0 <= y < self._class_map.shape[1]):
+                return int(self._class_map[x, y])
+            return TRACK_CLASS_IDS['WALL']  # Out of bounds is treated as wall
+
+        # No class map (numpy unavailable): classify the RGB query result
+        color = self.check_collision(x, y)
+        return _COLOR_TO_CLASS.get(
+            tuple(color), TRACK_CLASS_IDS['TRACK_SURFACE']
+        )
+
     def render(self, screen: pygame.Surface) -> None:
         """
         Render the track visual to the screen.
@@ -30,6 +30,32 @@ class WebSettingsInterface:
     that are compatible with web browsers via Pygbag.
     """
     
+    # (step, lo, hi) per settings_list index - acceleration 0.1-3.0 in
+    # 0.1 steps, max speed 1.0-20.0 in 0.5 steps, friction 0.1-2.0 in 0.1
+    # steps, turn speed 0.5-10.0 in 0.5 steps, same for both cars
+    SETTING_META = (
+        (0.1, 0.1, 3.0),
+        (0.5, 1.0, 20.0),
+        (0.1, 0.1, 2.0),
+        (0.5, 0.5, 10.0),
+        (0.1, 0.1, 3.0),
+        (0.5, 1.0, 20.0),
+        (0.1, 0.1, 2.0),
+        (0.5, 0.5, 10.0),
+    )
+
+    # User-friendly names, parallel to settings_list
+    DISPLAY_NAMES = (
+        'P1 Acceleration',
+        'P1 Max Speed',
+        'P1 Friction',
+        'P1 Turn Speed',
+        'P2 Acceleration',
+        'P2 Max Speed',
+        'P2 Friction',
+        'P2 Turn Speed',
+    )
+
     def __init__(self, screen: pygame.Surface) -> None:
         """
         Initialize the web settings interface.
@@ -61,17 +87,57 @@ class WebSettingsInterface:
         self.mouse_over_button: Optional[str] = None
         self.button_pressed: Optional[str] = None
         
-        # Create the GUI panel surface
-        self.panel_surface = pygame.Surface((GUI_WIDTH, GUI_HEIGHT), pygame.SRCALPHA)
-        
+        # Create the GUI panel surface, in the display's alpha format so
+        # the per-frame blit to the screen avoids pixel-format conversion
+        self.panel_surface = pygame.Surface(
+            (GUI_WIDTH, GUI_HEIGHT), pygame.SRCALPHA
+        ).convert_alpha()
+
         # Position the panel (centered on screen)
         screen_width, screen_height = screen.get_size()
         self.panel_x = (screen_width - GUI_WIDTH) // 2
         self.panel_y = (screen_height - GUI_HEIGHT) // 2
+
+        # Panel bounds in screen coordinates, for cheap mouse-motion
+        # rejection before any per-button hit testing
+        self._panel_rect = pygame.Rect(
+            self.panel_x, self.panel_y, GUI_WIDTH, GUI_HEIGHT
+        )
+        self._last_motion_pos: Optional[Tuple[int, int]] = None
+
+        # Static chrome (title, instructions, labels, neutral buttons) is
+        # rendered once; per-frame work is limited to values, the selection
+        # highlight, and button hover/press states
+        self._static_panel: Optional[pygame.Surface] = None
+        self._name_surfaces: list = []
+        self._build_static_panel()
+
+        # The panel composition is reused across frames and rebuilt only
+        # when something it shows has changed (selection, value, hover,
+        # press); while the user is just reading, render() is one blit
+        self._panel_dirty = True
+
+        # Rendered value surfaces keyed by the displayed value. Settings
+        # move in 0.1/0.5 steps over small ranges, so the cache stays tiny
+        # and steady-state frames do no freetype work for values
+        self._value_cache: Dict[float, pygame.Surface] = {}
+
+        # Selection-highlight rects are fixed per row; allocate them once
+        start_y = 120
+        self._highlight_rects = [
+            pygame.Rect(10, start_y + i * 40 - 5, GUI_WIDTH - 20, 35)
+            for i in range(len(self.settings_list))
+        ]
         
     def toggle_visibility(self) -> None:
         """Toggle the visibility of the settings interface."""
         self.visible = not self.visible
+        if self.visible:
+            # Hover/press state may be stale from before the panel was
+            # hidden; reset it and recomposite on the next frame
+            self.mouse_over_button = None
+            self.button_pressed = None
+            self._panel_dirty = True
         
     def is_visible(self) -> bool:
         """Check if the settings interface is currently visible."""
@@ -96,9 +162,11 @@ class WebSettingsInterface:
                 return True
             elif event.key == pygame.K_UP:
                 self.selected_setting = (self.selected_setting - 1) % len(self.settings_list)
+                self._panel_dirty = True
                 return True
             elif event.key == pygame.K_DOWN:
                 self.selected_setting = (self.selected_setting + 1) % len(self.settings_list)
+                self._panel_dirty = True
                 return True
             elif event.key == pygame.K_LEFT:
                 self._adjust_setting(-1)
@@ -120,6 +188,7 @@ class WebSettingsInterface:
                     for button_name, button_rect in self.buttons.items():
                         if button_rect.collidepoint(rel_x, rel_y):
                             self.button_pressed = button_name
+                            self._panel_dirty = True
                             self._handle_button_click(button_name)
                             return True
                     return True
@@ -130,21 +199,38 @@ class WebSettingsInterface:
                     
         elif event.type == pygame.MOUSEBUTTONUP:
             if event.button == 1:
+                if self.button_pressed is not None:
+                    self._panel_dirty = True
                 self.button_pressed = None
                 
         elif event.type == pygame.MOUSEMOTION:
-            if self.visible:
-                mouse_x, mouse_y = event.pos
-                rel_x = mouse_x - self.panel_x
-                rel_y = mouse_y - self.panel_y
-                
-                # Update hover state
-                self.mouse_over_button = None
-                for button_name, button_rect in self.buttons.items():
-                    if button_rect.collidepoint(rel_x, rel_y):
-                        self.mouse_over_button = button_name
-                        break
-                        
+            # Skip hit-testing when the pointer hasn't actually moved
+            if event.pos == self._last_motion_pos:
+                return False
+            self._last_motion_pos = event.pos
+
+            # Outside the panel no button can be hovered - reject with one
+            # rect test instead of walking the button dict
+            if not self._panel_rect.collidepoint(event.pos):
+                if self.mouse_over_button is not None:
+                    self.mouse_over_button = None
+                    self._panel_dirty = True
+                return False
+
+            mouse_x, mouse_y = event.pos
+            rel_x = mouse_x - self.panel_x
+            rel_y = mouse_y - self.panel_y
+
+            # Update hover state
+            hovered = None
+            for button_name, button_rect in self.buttons.items():
+                if button_rect.collidepoint(rel_x, rel_y):
+                    hovered = button_name
+                    break
+            if hovered != self.mouse_over_button:
+                self.mouse_over_button = hovered
+                self._panel_dirty = True
+
         return False
         
     def _handle_button_click(self, button_name: str) -> None:
@@ -171,43 +257,18 @@ class WebSettingsInterface:
         """
         setting_name = self.settings_list[self.selected_setting]
         current_value = getattr(game_settings, setting_name)
-        
-        # Determine adjustment amount based on setting type
-        if 'friction' in setting_name:
-            # Friction: 0.1 to 2.0 in steps of 0.1
-            adjustment = 0.1 * direction
-            new_value = max(0.1, min(2.0, current_value + adjustment))
-        elif 'acceleration' in setting_name:
-            # Acceleration: 0.1 to 3.0 in steps of 0.1
-            adjustment = 0.1 * direction
-            new_value = max(0.1, min(3.0, current_value + adjustment))
-        elif 'max_speed' in setting_name:
-            # Max speed: 1.0 to 20.0 in steps of 0.5
-            adjustment = 0.5 * direction
-            new_value = max(1.0, min(20.0, current_value + adjustment))
-        elif 'turn_speed' in setting_name:
-            # Turn speed: 0.5 to 10.0 in steps of 0.5
-            adjustment = 0.5 * direction
-            new_value = max(0.5, min(10.0, current_value + adjustment))
-        else:
-            return
-            
+
+        # Step and bounds come from the metadata row - no name checks
+        step, lo, hi = self.SETTING_META[self.selected_setting]
+        new_value = max(lo, min(hi, current_value + step * direction))
+
         # Apply the new value
         setattr(game_settings, setting_name, new_value)
+        self._panel_dirty = True
         
-    def _get_setting_display_name(self, setting_name: str) -> str:
-        """Get a user-friendly display name for a setting."""
-        names = {
-            'car1_acceleration': 'P1 Acceleration',
-            'car1_max_speed': 'P1 Max Speed',
-            'car1_friction': 'P1 Friction',
-            'car1_turn_speed': 'P1 Turn Speed',
-            'car2_acceleration': 'P2 Acceleration',
-            'car2_max_speed': 'P2 Max Speed',
-            'car2_friction': 'P2 Friction',
-            'car2_turn_speed': 'P2 Turn Speed',
-        }
-        return names.get(setting_name, setting_name)
+    def _get_setting_display_name(self, setting_index: int) -> str:
+        """Get a user-friendly display name for a setting by row index."""
+        return self.DISPLAY_NAMES[setting_index]
         
     def _draw_button(self, surface: pygame.Surface, rect: pygame.Rect, 
                     text: str, button_name: str) -> None:
@@ -228,27 +289,47 @@ class WebSettingsInterface:
         text_rect = text_surface.get_rect(center=rect.center)
         surface.blit(text_surface, text_rect)
         
-    def render(self) -> None:
-        """Render the settings interface if visible."""
-        if not self.visible:
-            return
-            
-        # Clear the panel surface
-        self.panel_surface.fill(PANEL_COLOR)
-        
+    def _value_surface(self, value: float) -> pygame.Surface:
+        """Get the rendered surface for a value, rasterizing on cache miss."""
+        key = round(value, 1)
+        surface = self._value_cache.get(key)
+        if surface is None:
+            surface = self.font.render(f"{key:.1f}", True, VALUE_COLOR)
+            self._value_cache[key] = surface
+        return surface
+
+    def _button_label(self, button_name: str) -> str:
+        """Get the label text for a button name."""
+        if button_name.endswith('_dec'):
+            return "-"
+        if button_name.endswith('_inc'):
+            return "+"
+        return "Close"
+
+    def _build_static_panel(self) -> None:
+        """
+        Render everything that never changes into a reusable surface.
+
+        Title, instructions, border, setting labels, and buttons in their
+        neutral state are rasterized once here; button geometry is
+        recorded in self.buttons at the same time.
+        """
+        # convert_alpha keeps the chrome in the display's format; the
+        # translucent background fill happens once here rather than per
+        # frame
+        panel = pygame.Surface(
+            (GUI_WIDTH, GUI_HEIGHT), pygame.SRCALPHA
+        ).convert_alpha()
+        panel.fill(PANEL_COLOR)
+
         # Draw border
-        pygame.draw.rect(self.panel_surface, BORDER_COLOR, 
-                        (0, 0, GUI_WIDTH, GUI_HEIGHT), 3)
-        
-        # Clear buttons dict for this frame
-        self.buttons.clear()
-        
+        pygame.draw.rect(panel, BORDER_COLOR, (0, 0, GUI_WIDTH, GUI_HEIGHT), 3)
+
         # Draw title
-        title_text = "Game Settings"
-        title_surface = self.title_font.render(title_text, True, HIGHLIGHT_COLOR)
+        title_surface = self.title_font.render("Game Settings", True, HIGHLIGHT_COLOR)
         title_rect = title_surface.get_rect(centerx=GUI_WIDTH // 2, y=20)
-        self.panel_surface.blit(title_surface, title_rect)
-        
+        panel.blit(title_surface, title_rect)
+
         # Draw instructions
         instructions = [
             "Use arrow keys or mouse to adjust",
@@ -258,45 +339,87 @@ class WebSettingsInterface:
         for instruction in instructions:
             inst_surface = self.small_font.render(instruction, True, TEXT_COLOR)
             inst_rect = inst_surface.get_rect(centerx=GUI_WIDTH // 2, y=y_offset)
-            self.panel_surface.blit(inst_surface, inst_rect)
+            panel.blit(inst_surface, inst_rect)
             y_offset += 25
-            
-        # Draw settings
+
+        # Setting labels and adjustment buttons
+        self.buttons.clear()
+        self._name_surfaces = []
         start_y = 120
         for i, setting_name in enumerate(self.settings_list):
             y_pos = start_y + i * 40
-            
-            # Highlight selected setting
-            if i == self.selected_setting:
-                highlight_rect = pygame.Rect(10, y_pos - 5, GUI_WIDTH - 20, 35)
-                pygame.draw.rect(self.panel_surface, (60, 60, 60), highlight_rect)
-                pygame.draw.rect(self.panel_surface, HIGHLIGHT_COLOR, highlight_rect, 2)
-            
-            # Setting name
-            display_name = self._get_setting_display_name(setting_name)
+
+            # Setting name (kept for re-drawing over the highlight)
+            display_name = self._get_setting_display_name(i)
             name_surface = self.font.render(display_name, True, TEXT_COLOR)
-            self.panel_surface.blit(name_surface, (20, y_pos))
-            
-            # Current value
-            current_value = getattr(game_settings, setting_name)
-            value_text = f"{current_value:.1f}"
-            value_surface = self.font.render(value_text, True, VALUE_COLOR)
-            self.panel_surface.blit(value_surface, (200, y_pos))
-            
+            self._name_surfaces.append((name_surface, (20, y_pos)))
+            panel.blit(name_surface, (20, y_pos))
+
             # Decrease button
             dec_rect = pygame.Rect(270, y_pos, 30, 25)
             self.buttons[f"{setting_name}_dec"] = dec_rect
-            self._draw_button(self.panel_surface, dec_rect, "-", f"{setting_name}_dec")
-            
+            self._draw_button(panel, dec_rect, "-", f"{setting_name}_dec")
+
             # Increase button
             inc_rect = pygame.Rect(310, y_pos, 30, 25)
             self.buttons[f"{setting_name}_inc"] = inc_rect
-            self._draw_button(self.panel_surface, inc_rect, "+", f"{setting_name}_inc")
-            
+            self._draw_button(panel, inc_rect, "+", f"{setting_name}_inc")
+
         # Close button
         close_rect = pygame.Rect(GUI_WIDTH - 80, 10, 60, 30)
         self.buttons["close"] = close_rect
-        self._draw_button(self.panel_surface, close_rect, "Close", "close")
-        
+        self._draw_button(panel, close_rect, "Close", "close")
+
+        self._static_panel = panel
+
+    def render(self) -> None:
+        """Render the settings interface if visible."""
+        if not self.visible:
+            return
+
+        # Reuse the previous composition unless some displayed state
+        # changed since it was built
+        if not self._panel_dirty:
+            self.screen.blit(self.panel_surface, (self.panel_x, self.panel_y))
+            return
+        self._panel_dirty = False
+
+        # Start from a straight copy of the pre-rendered chrome (a normal
+        # blit would alpha-blend it over the previous composition and
+        # leave ghosts of the old highlight and values)
+        self.panel_surface = self._static_panel.copy()
+
+        # Highlight the selected setting, then restore the row content the
+        # highlight fill just covered
+        start_y = 120
+        highlight_rect = self._highlight_rects[self.selected_setting]
+        pygame.draw.rect(self.panel_surface, (60, 60, 60), highlight_rect)
+        pygame.draw.rect(self.panel_surface, HIGHLIGHT_COLOR, highlight_rect, 2)
+        name_surface, name_pos = self._name_surfaces[self.selected_setting]
+        self.panel_surface.blit(name_surface, name_pos)
+
+        # Current values (cached per displayed value)
+        for i, setting_name in enumerate(self.settings_list):
+            current_value = getattr(game_settings, setting_name)
+            self.panel_surface.blit(
+                self._value_surface(current_value), (200, start_y + i * 40)
+            )
+
+        # Buttons not in their baked neutral state: the selected row's
+        # (covered by the highlight) plus any hovered or pressed button
+        selected_name = self.settings_list[self.selected_setting]
+        to_redraw = {f"{selected_name}_dec", f"{selected_name}_inc"}
+        if self.mouse_over_button:
+            to_redraw.add(self.mouse_over_button)
+        if self.button_pressed:
+            to_redraw.add(self.button_pressed)
+        for button_name in to_redraw:
+            button_rect = self.buttons.get(button_name)
+            if button_rect:
+                self._draw_button(
+                    self.panel_surface, button_rect,
+                    self._button_label(button_name), button_name
+                )
+
         # Blit the panel to the main screen
         self.screen.blit(self.panel_surface, (self.panel_x, self.panel_y))